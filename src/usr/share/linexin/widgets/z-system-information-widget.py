@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 
 import gi
+import asyncio
+import contextlib
 import subprocess
 import threading
+import time
 import gettext
+import functools
 import locale
 import os
-import distro
-import psutil
+import re
+import signal
+import concurrent.futures
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
@@ -15,7 +20,24 @@ gi.require_version("Adw", "1")
 # VTE detection - try different version strings that VTE4 might use
 VTE_AVAILABLE = False
 VTE_VERSION = None
-for version in ["4.0", "3.91", "2.91"]:
+VTE_VERSIONS = ["4.0", "3.91", "2.91"]
+VTE_CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "linexin", "vte_version"
+)
+
+# Try the version that worked last time first
+cached_vte_version = None
+try:
+    with open(VTE_CACHE_FILE, 'r') as f:
+        cached_vte_version = f.read().strip()
+except OSError:
+    pass
+if cached_vte_version in VTE_VERSIONS:
+    VTE_VERSIONS.remove(cached_vte_version)
+    VTE_VERSIONS.insert(0, cached_vte_version)
+
+for version in VTE_VERSIONS:
     try:
         gi.require_version("Vte", version)
         from gi.repository import Vte
@@ -26,11 +48,26 @@ for version in ["4.0", "3.91", "2.91"]:
     except (ValueError, ImportError):
         continue
 
+if VTE_AVAILABLE and VTE_VERSION != cached_vte_version:
+    try:
+        os.makedirs(os.path.dirname(VTE_CACHE_FILE), exist_ok=True)
+        with open(VTE_CACHE_FILE, 'w') as f:
+            f.write(VTE_VERSION)
+    except OSError:
+        pass
+
 if not VTE_AVAILABLE:
     print("No VTE version available")
 
 from gi.repository import Gtk, Adw, GLib, Pango
 
+# python-xlib is optional, xprop is used when it is missing
+try:
+    from Xlib import display as xdisplay, X
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
 
 # --- Localization Setup ---
 APP_NAME = "system-information"
@@ -43,6 +80,132 @@ gettext.textdomain(APP_NAME)
 _ = gettext.gettext
 # --------------------------
 
+# Info row labels, translated once
+_LBL_OS = _("Operating System")
+_LBL_VERSION_ID = _("Version ID")
+_LBL_VERSION_DATE = _("Version Date")
+_LBL_KERNEL = _("Kernel")
+_LBL_SESSION = _("Session Type")
+_LBL_DESKTOP = _("Desktop Environment")
+_LBL_WM = _("Window Manager")
+_LBL_CPU = _("Processor")
+_LBL_GPU = _("Graphics")
+_LBL_MEMORY = _("Memory")
+_LBL_DISK = _("Disk Usage")
+_LBL_UPTIME = _("Uptime")
+_LBL_ERROR = _("Error")
+
+# PCI vendor IDs used when pci.ids is not available
+PCI_VENDORS = {
+    '10de': 'NVIDIA Corporation',
+    '1002': 'Advanced Micro Devices, Inc.',
+    '8086': 'Intel Corporation',
+}
+
+PCI_IDS_PATHS = [
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+]
+
+# ANSI escape sequences stripped from fastfetch output, in one pass:
+# CSI (colors, cursor movement, modes), OSC (titles) and two-character escapes
+_ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]|\x1B\][^\x07\x1B]*(?:\x07|\x1B\\)|\x1B[@-Z\\-_7-8=>]')
+
+# uname data does not change for the lifetime of the process
+try:
+    _UNAME = os.uname()
+except:
+    _UNAME = None
+
+
+# Event loop for subprocess I/O, created on first use
+_ASYNC_LOOP = None
+
+
+def _get_async_loop():
+    """Return the shared asyncio loop, running on its own daemon thread"""
+    global _ASYNC_LOOP
+    if _ASYNC_LOOP is None:
+        _ASYNC_LOOP = asyncio.new_event_loop()
+        threading.Thread(target=_ASYNC_LOOP.run_forever, daemon=True).start()
+    return _ASYNC_LOOP
+
+
+@functools.lru_cache(maxsize=1)
+def _read_os_release():
+    """Parse os-release into a dict, read once per process"""
+    for path in ('/etc/os-release', '/usr/lib/os-release'):
+        try:
+            os_release = {}
+            with open(path, 'r') as f:
+                for line in f:
+                    key, sep, value = line.partition('=')
+                    if sep:
+                        os_release[key.strip()] = value.strip().strip('"\'')
+            return os_release
+        except OSError:
+            continue
+    return {}
+
+
+# Info row layout, compiled by GTK once when the template class is created
+INFO_ROW_UI = """
+<interface>
+  <template class="LinexinSysInfoRow" parent="GtkListBoxRow">
+    <property name="selectable">False</property>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">horizontal</property>
+        <property name="spacing">12</property>
+        <property name="margin-top">10</property>
+        <property name="margin-bottom">10</property>
+        <property name="margin-start">12</property>
+        <property name="margin-end">12</property>
+        <child>
+          <object class="GtkImage" id="icon_image">
+            <property name="pixel-size">20</property>
+            <property name="visible">False</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="label_widget">
+            <property name="halign">start</property>
+            <property name="hexpand">True</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="value_widget">
+            <property name="halign">end</property>
+            <!-- Allow copying -->
+            <property name="selectable">True</property>
+            <style>
+              <class name="dim-label"/>
+            </style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </template>
+</interface>
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _info_row_class():
+    """Create the info row template class on first use"""
+    # Defined here rather than at module level, since linexin-center
+    # instantiates every class in the module while looking for widgets
+    @Gtk.Template(string=INFO_ROW_UI)
+    class InfoRow(Gtk.ListBoxRow):
+        """Row with an optional icon, a label and a selectable value"""
+        __gtype_name__ = "LinexinSysInfoRow"
+        
+        icon_image = Gtk.Template.Child()
+        label_widget = Gtk.Template.Child()
+        value_widget = Gtk.Template.Child()
+    
+    return InfoRow
+
 
 class LinexinSysInfoWidget(Gtk.Box):
     def __init__(self, hide_sidebar=False, window=None):
@@ -66,6 +229,12 @@ class LinexinSysInfoWidget(Gtk.Box):
         # View state
         self.current_view = "rows"  # "rows" or "fastfetch"
         
+        # Text fallback output, kept so fastfetch only runs once per session
+        self._fastfetch_cache = None
+        
+        # Set while a text run is streaming, so only one runs at a time
+        self._fastfetch_running = False
+        
         # Create main content
         self.setup_ui()
         
@@ -111,15 +280,13 @@ class LinexinSysInfoWidget(Gtk.Box):
         title_label.set_halign(Gtk.Align.START)
         title_box.append(title_label)
         
-        try:
-            hostname = os.uname().nodename
+        if _UNAME:
+            hostname = _UNAME.nodename
             hostname_label = Gtk.Label(label=hostname)
             hostname_label.add_css_class("title-4")
             hostname_label.add_css_class("dim-label")
             hostname_label.set_halign(Gtk.Align.START)
             title_box.append(hostname_label)
-        except:
-            pass
         
         header_box.append(title_box)
         
@@ -140,8 +307,7 @@ class LinexinSysInfoWidget(Gtk.Box):
         # Row view (existing info list)
         self.setup_row_view()
         
-        # Fastfetch view
-        self.setup_fastfetch_view()
+        # Fastfetch view is created on first use in on_view_toggle_clicked
         
         self.append(self.content_stack)
     
@@ -221,6 +387,8 @@ class LinexinSysInfoWidget(Gtk.Box):
         if self.current_view == "rows":
             self.current_view = "fastfetch"
             self.view_toggle_button.set_label(_("Row View"))
+            if not hasattr(self, 'terminal_available'):
+                self.setup_fastfetch_view()
             self.content_stack.set_visible_child_name("fastfetch")
             self.load_fastfetch_info()
         else:
@@ -286,18 +454,78 @@ class LinexinSysInfoWidget(Gtk.Box):
     
     def load_fastfetch_text(self):
         """Load fastfetch in text view"""
-        def run_fastfetch():
-            try:
-                result = subprocess.run(['fastfetch', '--color-output', 'never'], 
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    output = result.stdout
+        # A run in progress keeps streaming into the buffer
+        if self._fastfetch_running:
+            return
+        if self._fastfetch_cache is not None:
+            self.update_fastfetch_text(self._fastfetch_cache)
+            return
+        
+        self._fastfetch_running = True
+        
+        async def stream_fastfetch(args, clean=False):
+            """Run fastfetch and push its output to the text view as it arrives, returns the full output"""
+            proc = await asyncio.create_subprocess_exec(
+                *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+                # Own process group, so a timeout also kills children holding stdout
+                start_new_session=True
+            )
+            
+            output = []
+            pending = []
+            flushed = False
+            last_flush = time.monotonic()
+            
+            def flush():
+                nonlocal flushed, last_flush
+                text = ''.join(pending)
+                pending.clear()
+                output.append(text)
+                # The first chunk replaces the loading message
+                if flushed:
+                    GLib.idle_add(self.append_fastfetch_text, text)
                 else:
-                    result = subprocess.run(['fastfetch'], capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        output = self.clean_fastfetch_output(result.stdout)
-                    else:
-                        output = _("Fastfetch command failed or not installed")
+                    GLib.idle_add(self.update_fastfetch_text, text)
+                flushed = True
+                last_flush = time.monotonic()
+            
+            async def read_output():
+                while True:
+                    line = await proc.stdout.readline()
+                    if not line:
+                        break
+                    line = line.decode('utf-8', errors='replace')
+                    pending.append(self.clean_fastfetch_output(line) if clean else line)
+                    if time.monotonic() - last_flush >= 0.05:
+                        flush()
+                return await proc.wait()
+            
+            try:
+                returncode = await asyncio.wait_for(read_output(), timeout=10)
+            except asyncio.TimeoutError:
+                # The process may exit on its own right at the deadline
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+                # wait() also waits for the pipe to close, don't let an escaped child hold it
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(proc.wait(), timeout=1)
+                raise subprocess.TimeoutExpired(args, 10)
+            
+            if returncode != 0:
+                return None
+            if pending or not flushed:
+                flush()
+            return ''.join(output)
+        
+        async def run_fastfetch():
+            try:
+                output = await stream_fastfetch(['fastfetch', '--color-output', 'never'])
+                if output is None:
+                    output = await stream_fastfetch(['fastfetch'], clean=True)
+                if output is not None:
+                    self._fastfetch_cache = output
+                    return
+                output = _("Fastfetch command failed or not installed")
             except subprocess.TimeoutExpired:
                 output = _("Fastfetch command timed out")
             except FileNotFoundError:
@@ -307,20 +535,23 @@ class LinexinSysInfoWidget(Gtk.Box):
             
             GLib.idle_add(self.update_fastfetch_text, output)
         
+        async def run_and_finish():
+            try:
+                await run_fastfetch()
+            finally:
+                # Queued after this run's output, so the flag clears once it is all shown
+                GLib.idle_add(self.finish_fastfetch_run)
+        
         # Show loading only if we have text buffer
         if hasattr(self, 'fastfetch_buffer'):
             self.fastfetch_buffer.set_text(_("Loading fastfetch output..."))
         
-        threading.Thread(target=run_fastfetch, daemon=True).start()
+        # Shared event loop off the GTK main thread
+        asyncio.run_coroutine_threadsafe(run_and_finish(), _get_async_loop())
     
     def clean_fastfetch_output(self, text):
         """Clean fastfetch output while preserving ASCII art"""
-        import re
-        cursor_codes = re.compile(r'\x1B\[[0-9]*[ABCD]|\x1B\[[0-9]*G|\x1B\[[0-9]*C')
-        text = cursor_codes.sub('', text)
-        color_codes = re.compile(r'\x1B\[[0-9;]*m')
-        text = color_codes.sub('', text)
-        return text
+        return _ANSI_RE.sub('', text)
     
     def update_fastfetch_text(self, output):
         """Update text view with fastfetch output"""
@@ -328,37 +559,28 @@ class LinexinSysInfoWidget(Gtk.Box):
             self.fastfetch_buffer.set_text(output)
         return False
     
+    def finish_fastfetch_run(self):
+        """Mark the fastfetch text run as finished"""
+        self._fastfetch_running = False
+        return False
+    
+    def append_fastfetch_text(self, output):
+        """Append fastfetch output to the end of the text view"""
+        if hasattr(self, 'fastfetch_buffer'):
+            self.fastfetch_buffer.insert(self.fastfetch_buffer.get_end_iter(), output)
+        return False
+    
     def create_info_row(self, label, value, icon_name=None):
         """Create a row with label and value"""
-        row = Gtk.ListBoxRow()
-        row.set_selectable(False)
-        
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_top(10)
-        box.set_margin_bottom(10)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
+        row = _info_row_class()()
         
         # Icon (optional)
         if icon_name:
-            icon = Gtk.Image.new_from_icon_name(icon_name)
-            icon.set_pixel_size(20)
-            box.append(icon)
-        
-        # Label
-        label_widget = Gtk.Label(label=label)
-        label_widget.set_halign(Gtk.Align.START)
-        label_widget.set_hexpand(True)
-        box.append(label_widget)
-        
-        # Value
-        value_widget = Gtk.Label(label=str(value))
-        value_widget.add_css_class("dim-label")
-        value_widget.set_halign(Gtk.Align.END)
-        value_widget.set_selectable(True)  # Allow copying
-        box.append(value_widget)
-        
-        row.set_child(box)
+            row.icon_image.set_from_icon_name(icon_name)
+            row.icon_image.set_visible(True)
+        
+        row.label_widget.set_label(label)
+        row.value_widget.set_label(str(value))
         return row
     
     def format_bytes(self, bytes_value):
@@ -369,29 +591,35 @@ class LinexinSysInfoWidget(Gtk.Box):
             bytes_value /= 1024.0
         return f"{bytes_value:.1f} PB"
     
-    def get_cpu_info(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_cpu_info():
         """Get CPU information"""
         try:
+            # The first processor entry, including its model name, fits in the first page
             with open('/proc/cpuinfo', 'r') as f:
-                for line in f:
-                    if line.startswith('model name'):
-                        return line.split(':')[1].strip()
+                data = f.read(4096)
+            _sep, found, rest = data.partition('model name')
+            if found:
+                _sep, _sep, rest = rest.partition(':')
+                model = rest.split('\n', 1)[0].strip()
+                if model:
+                    return model
         except:
             pass
         return _("Unknown")
     
-    def get_kernel_info(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_kernel_info():
         """Get kernel information"""
-        try:
-            return os.uname().release
-        except:
-            return _("Unknown")
+        return _UNAME.release if _UNAME else _("Unknown")
     
     def get_uptime(self):
         """Get system uptime"""
         try:
+            import psutil
             uptime_seconds = psutil.boot_time()
-            import time
             uptime = time.time() - uptime_seconds
             
             days = int(uptime // 86400)
@@ -407,7 +635,20 @@ class LinexinSysInfoWidget(Gtk.Box):
         except:
             return _("Unknown")
     
-    def get_version_date(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_os_name():
+        """Get operating system name"""
+        os_release = _read_os_release()
+        os_name = os_release.get('PRETTY_NAME')
+        if not os_name:
+            name = os_release.get('NAME') or os_release.get('ID', 'Linux')
+            os_name = f"{name} {os_release.get('VERSION_ID', '')}".strip()
+        return os_name
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_version_date():
         """Get Version Date from /version file"""
         try:
             with open('/version', 'r') as f:
@@ -417,16 +658,11 @@ class LinexinSysInfoWidget(Gtk.Box):
             pass
         return None
 
-    def get_version_id(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_version_id():
         """Get VERSION_ID from os-release"""
-        try:
-            with open('/etc/os-release', 'r') as f:
-                for line in f:
-                    if line.startswith('VERSION_ID='):
-                        return line.split('=')[1].strip().strip('"')
-        except:
-            pass
-        return None
+        return _read_os_release().get('VERSION_ID')
 
     def get_session_type(self):
         """Get session type (X11/Wayland)"""
@@ -435,7 +671,9 @@ class LinexinSysInfoWidget(Gtk.Box):
             return session_type.capitalize()
         return _("Unknown")
 
-    def get_desktop_environment(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_desktop_environment():
         """Get desktop environment"""
         # Try various environment variables
         for env_var in ['XDG_CURRENT_DESKTOP', 'DESKTOP_SESSION', 'XDG_SESSION_DESKTOP']:
@@ -475,64 +713,129 @@ class LinexinSysInfoWidget(Gtk.Box):
             return os.path.basename(wm)
         
         # Check for common window managers in processes
+        import psutil
         try:
-            result = subprocess.run(['ps', 'aux'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                # Define window manager mappings (process name -> display name)
-                wm_mapping = {
-                    'mutter': 'Mutter',
-                    'kwin_x11': 'KWin',
-                    'kwin_wayland': 'KWin', 
-                    'kwin': 'KWin',
-                    'xfwm4': 'Xfwm4',
-                    'openbox': 'Openbox',
-                    'i3': 'i3',
-                    'sway': 'Sway',
-                    'awesome': 'Awesome',
-                    'dwm': 'DWM',
-                    'bspwm': 'bspwm',
-                    'qtile': 'Qtile',
-                    'herbstluftwm': 'herbstluftwm',
-                    'fluxbox': 'Fluxbox',
-                    'marco': 'Marco',
-                    'metacity': 'Metacity',
-                    'compiz': 'Compiz',
-                    'enlightenment': 'Enlightenment',
-                    'cwm': 'CWM',
-                    'jwm': 'JWM'
-                }
-                
-                # Check for each window manager in order of preference
-                for wm_proc, wm_name in wm_mapping.items():
-                    if wm_proc in result.stdout:
-                        return wm_name
-        except (subprocess.SubprocessError, FileNotFoundError):
+            # Define window manager mappings (process name -> display name)
+            wm_mapping = {
+                'mutter': 'Mutter',
+                # GNOME Shell runs Mutter in-process, there is no separate mutter process
+                'gnome-shell': 'Mutter',
+                'kwin_x11': 'KWin',
+                'kwin_wayland': 'KWin', 
+                'kwin': 'KWin',
+                'xfwm4': 'Xfwm4',
+                'openbox': 'Openbox',
+                'i3': 'i3',
+                'sway': 'Sway',
+                'awesome': 'Awesome',
+                'dwm': 'DWM',
+                'bspwm': 'bspwm',
+                'qtile': 'Qtile',
+                'herbstluftwm': 'herbstluftwm',
+                'fluxbox': 'Fluxbox',
+                'marco': 'Marco',
+                'metacity': 'Metacity',
+                'compiz': 'Compiz',
+                'enlightenment': 'Enlightenment',
+                'cwm': 'CWM',
+                'jwm': 'JWM'
+            }
+            
+            # Collect names of running processes that match a known window manager
+            running = set()
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if name in wm_mapping:
+                    running.add(name)
+            
+            # Check for each window manager in order of preference
+            for wm_proc, wm_name in wm_mapping.items():
+                if wm_proc in running:
+                    return wm_name
+        except psutil.Error:
             pass
         
         # Try X11 method as fallback
+        # For X11 sessions only
+        if os.environ.get('DISPLAY'):
+            wm_name = self.get_x11_wm_name()
+            # Don't use GNOME Shell as window manager name, prefer process detection
+            if wm_name and wm_name.lower() != 'gnome shell':
+                return wm_name
+        
+        return _("Unknown")
+
+    def get_x11_wm_name(self):
+        """Get the _NET_WM_NAME of the window manager's supporting window"""
+        if XLIB_AVAILABLE:
+            try:
+                x_display = xdisplay.Display()
+                try:
+                    root = x_display.screen().root
+                    check_atom = x_display.intern_atom('_NET_SUPPORTING_WM_CHECK')
+                    check = root.get_full_property(check_atom, X.AnyPropertyType)
+                    if check and check.value:
+                        wm_window = x_display.create_resource_object('window', check.value[0])
+                        name_atom = x_display.intern_atom('_NET_WM_NAME')
+                        name = wm_window.get_full_property(name_atom, X.AnyPropertyType)
+                        if name and name.value:
+                            value = name.value
+                            if isinstance(value, bytes):
+                                value = value.decode('utf-8', errors='replace')
+                            return value
+                finally:
+                    x_display.close()
+                return None
+            except Exception as e:
+                print(f"Xlib window manager lookup failed: {e}")
+        
         try:
-            # For X11 sessions only
-            if os.environ.get('DISPLAY'):
-                result = subprocess.run(['xprop', '-root', '_NET_SUPPORTING_WM_CHECK'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and 'window id' in result.stdout:
-                    wm_id = result.stdout.split()[-1]
-                    result2 = subprocess.run(['xprop', '-id', wm_id, '_NET_WM_NAME'], 
-                                           capture_output=True, text=True, timeout=5)
-                    if result2.returncode == 0 and '=' in result2.stdout:
-                        wm_name = result2.stdout.split('=')[1].strip().strip('"')
-                        # Don't use GNOME Shell as window manager name, prefer process detection
-                        if wm_name.lower() != 'gnome shell':
-                            return wm_name
+            result = subprocess.run(['xprop', '-root', '_NET_SUPPORTING_WM_CHECK'], 
+                                  capture_output=True, text=True, timeout=5)
+            if result.returncode == 0 and 'window id' in result.stdout:
+                wm_id = result.stdout.split()[-1]
+                result2 = subprocess.run(['xprop', '-id', wm_id, '_NET_WM_NAME'], 
+                                       capture_output=True, text=True, timeout=5)
+                if result2.returncode == 0 and '=' in result2.stdout:
+                    return result2.stdout.split('=')[1].strip().strip('"')
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
-        
-        return _("Unknown")
+        return None
 
     def get_gpu_info(self):
         """Get GPU card name and driver information"""
+        # Query hardware and the NVIDIA driver at the same time
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            name_future = executor.submit(self.get_gpu_name)
+            nvidia_future = executor.submit(self.get_nvidia_driver)
+            gpu_name = name_future.result()
+            driver_version = nvidia_future.result()
+        
+        # Fall back to loaded kernel modules, in order of preference
+        if not driver_version:
+            driver_version = self.get_amdgpu_driver()
+        if not driver_version:
+            driver_version = self.get_i915_driver()
+        
+        # Combine GPU name and driver
+        if driver_version:
+            return f"{gpu_name} ({driver_version})"
+        else:
+            return gpu_name
+
+    def get_gpu_name(self):
+        """Get GPU card name"""
         gpu_name = _("Unknown")
-        driver_version = None
+        
+        try:
+            # Read display controllers straight from sysfs
+            gpu_part = self.get_pci_display_device()
+            if gpu_part:
+                gpu_name = self.clean_gpu_name(gpu_part)
+            return gpu_name
+        except OSError:
+            # Missing, masked or unreadable sysfs, fall back to lspci
+            pass
         
         try:
             # Get GPU hardware info from lspci
@@ -551,65 +854,104 @@ class LinexinSysInfoWidget(Gtk.Box):
                             if '(rev' in gpu_part:
                                 gpu_part = gpu_part.split('(rev')[0].strip()
                             
-                            # Extract just the card name (remove manufacturer prefix if it's repeated)
-                            if 'NVIDIA Corporation' in gpu_part:
-                                gpu_part = gpu_part.replace('NVIDIA Corporation ', '')
-                                if '[' in gpu_part and ']' in gpu_part:
-                                    # Extract name from brackets if available
-                                    bracket_content = gpu_part[gpu_part.find('[')+1:gpu_part.find(']')]
-                                    gpu_name = bracket_content
-                                else:
-                                    gpu_name = gpu_part
-                            elif 'AMD' in gpu_part or 'Advanced Micro Devices' in gpu_part:
-                                gpu_part = gpu_part.replace('Advanced Micro Devices, Inc. ', '')
-                                gpu_part = gpu_part.replace('AMD ', '')
-                                if '[' in gpu_part and ']' in gpu_part:
-                                    bracket_content = gpu_part[gpu_part.find('[')+1:gpu_part.find(']')]
-                                    gpu_name = bracket_content
-                                else:
-                                    gpu_name = gpu_part
-                            elif 'Intel' in gpu_part:
-                                gpu_part = gpu_part.replace('Intel Corporation ', '')
-                                gpu_name = gpu_part
-                            else:
-                                gpu_name = gpu_part
+                            gpu_name = self.clean_gpu_name(gpu_part)
                             break
-        except (subprocess.SubprocessError, FileNotFoundError):
+        except (subprocess.SubprocessError, OSError):
             pass
         
-        # Get driver version
+        return gpu_name
+
+    def get_pci_display_device(self):
+        """Get "<vendor> <device>" of the first display controller from sysfs"""
+        pci_root = '/sys/bus/pci/devices'
+        for dev in sorted(os.listdir(pci_root)):
+            dev_path = os.path.join(pci_root, dev)
+            with open(os.path.join(dev_path, 'class'), 'r') as f:
+                dev_class = f.read().strip()
+            # VGA compatible, 3D and display controllers
+            if not dev_class.startswith(('0x0300', '0x0302', '0x0380')):
+                continue
+            
+            with open(os.path.join(dev_path, 'vendor'), 'r') as f:
+                vendor_id = f.read().strip()[2:].lower()
+            with open(os.path.join(dev_path, 'device'), 'r') as f:
+                device_id = f.read().strip()[2:].lower()
+            
+            vendor_name, device_name = self.lookup_pci_ids(vendor_id, device_id)
+            if not vendor_name:
+                vendor_name = PCI_VENDORS.get(vendor_id, vendor_id)
+            if not device_name:
+                device_name = f"Device {device_id}"
+            return f"{vendor_name} {device_name}"
+        return None
+
+    def lookup_pci_ids(self, vendor_id, device_id):
+        """Resolve vendor and device names from the pci.ids database"""
+        for path in PCI_IDS_PATHS:
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    vendor_name = None
+                    for line in f:
+                        if vendor_name is None:
+                            # Vendor lines are unindented: "10de  NVIDIA Corporation"
+                            if line.startswith(vendor_id):
+                                vendor_name = line[len(vendor_id):].strip()
+                        elif line.startswith('\t\t') or line.startswith('#'):
+                            continue
+                        elif line.startswith('\t'):
+                            # Device lines are indented once: "\t2484  GA104 [GeForce RTX 3070]"
+                            if line[1:].startswith(device_id):
+                                return vendor_name, line[1 + len(device_id):].strip()
+                        elif line.strip():
+                            # Reached the next vendor without finding the device
+                            break
+                    return vendor_name, None
+            except OSError:
+                continue
+        return None, None
+
+    def clean_gpu_name(self, gpu_part):
+        """Extract just the card name (remove manufacturer prefix if it's repeated)"""
+        if 'NVIDIA Corporation' in gpu_part:
+            gpu_part = gpu_part.replace('NVIDIA Corporation ', '')
+            if '[' in gpu_part and ']' in gpu_part:
+                # Extract name from brackets if available
+                return gpu_part[gpu_part.find('[')+1:gpu_part.find(']')]
+            return gpu_part
+        elif 'AMD' in gpu_part or 'Advanced Micro Devices' in gpu_part:
+            gpu_part = gpu_part.replace('Advanced Micro Devices, Inc. ', '')
+            gpu_part = gpu_part.replace('AMD ', '')
+            if '[' in gpu_part and ']' in gpu_part:
+                return gpu_part[gpu_part.find('[')+1:gpu_part.find(']')]
+            return gpu_part
+        elif 'Intel' in gpu_part:
+            return gpu_part.replace('Intel Corporation ', '')
+        return gpu_part
+
+    def get_nvidia_driver(self):
+        """Get NVIDIA driver version"""
         try:
             # Check for NVIDIA driver version
             result = subprocess.run(['nvidia-smi', '--query-gpu=driver_version', '--format=csv,noheader,nounits'], 
                                    capture_output=True, text=True, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
-                driver_version = f"NVIDIA {result.stdout.strip()}"
+                return f"NVIDIA {result.stdout.strip()}"
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
-        
-        if not driver_version:
-            try:
-                # Check for AMD driver (amdgpu)
-                result = subprocess.run(['modinfo', 'amdgpu'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    driver_version = "AMDGPU"
-            except (subprocess.SubprocessError, FileNotFoundError):
-                pass
-        
-        if not driver_version:
-            try:
-                # Check for Intel driver
-                result = subprocess.run(['modinfo', 'i915'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    driver_version = "Intel i915"
-            except (subprocess.SubprocessError, FileNotFoundError):
-                pass
-        
-        # Combine GPU name and driver
-        if driver_version:
-            return f"{gpu_name} ({driver_version})"
-        else:
-            return gpu_name
+        return None
+
+    def get_amdgpu_driver(self):
+        """Get AMD driver (amdgpu)"""
+        # A loaded kernel module is listed under /sys/module
+        if os.path.isdir('/sys/module/amdgpu'):
+            return "AMDGPU"
+        return None
+
+    def get_i915_driver(self):
+        """Get Intel driver (i915)"""
+        if os.path.isdir('/sys/module/i915'):
+            return "Intel i915"
+        return None
 
     def load_system_info(self):
         """Load and display system information"""
@@ -617,65 +959,74 @@ class LinexinSysInfoWidget(Gtk.Box):
             info_data = []
             
             try:
-                # Operating System
-                os_name = distro.name(pretty=True)
-                if not os_name:
-                    os_name = f"{distro.id()} {distro.version()}"
-                info_data.append((_("Operating System"), os_name, "computer"))
+                # Imported here to keep psutil out of widget discovery at startup
+                import psutil
                 
-                # Version ID
-                version_id = self.get_version_id()
-                if version_id:
-                    info_data.append((_("Version ID"), version_id, "application-certificate"))
+                # Run the slow probes concurrently; results are collected in display order below
+                with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
+                    desktop_env_future = executor.submit(self.get_desktop_environment)
+                    window_manager_future = executor.submit(self.get_window_manager)
+                    cpu_info_future = executor.submit(self.get_cpu_info)
+                    gpu_info_future = executor.submit(self.get_gpu_info)
+                    uptime_future = executor.submit(self.get_uptime)
+                    
+                    # Operating System
+                    os_name = self.get_os_name()
+                    info_data.append((_LBL_OS, os_name, "computer"))
                 
-                # Version Date
-                version_date = self.get_version_date()
-                if version_date:
-                    info_data.append((_("Version Date"), version_date, "preferences-system-time"))
+                    # Version ID
+                    version_id = self.get_version_id()
+                    if version_id:
+                        info_data.append((_LBL_VERSION_ID, version_id, "application-certificate"))
                 
-                # Kernel
-                kernel = self.get_kernel_info()
-                info_data.append((_("Kernel"), kernel, "application-x-firmware"))
+                    # Version Date
+                    version_date = self.get_version_date()
+                    if version_date:
+                        info_data.append((_LBL_VERSION_DATE, version_date, "preferences-system-time"))
                 
-                # Session Type (X11/Wayland)
-                session_type = self.get_session_type()
-                info_data.append((_("Session Type"), session_type, "preferences-desktop-display"))
+                    # Kernel
+                    kernel = self.get_kernel_info()
+                    info_data.append((_LBL_KERNEL, kernel, "application-x-firmware"))
                 
-                # Desktop Environment
-                desktop_env = self.get_desktop_environment()
-                info_data.append((_("Desktop Environment"), desktop_env, "preferences-desktop"))
+                    # Session Type (X11/Wayland)
+                    session_type = self.get_session_type()
+                    info_data.append((_LBL_SESSION, session_type, "preferences-desktop-display"))
                 
-                # Window Manager
-                window_manager = self.get_window_manager()
-                info_data.append((_("Window Manager"), window_manager, "preferences-desktop-wallpaper"))
+                    # Desktop Environment
+                    desktop_env = desktop_env_future.result()
+                    info_data.append((_LBL_DESKTOP, desktop_env, "preferences-desktop"))
                 
-                # CPU
-                cpu_info = self.get_cpu_info()
-                cpu_count = psutil.cpu_count()
-                cpu_text = f"{cpu_info} ({cpu_count} cores)"
-                info_data.append((_("Processor"), cpu_text, "applications-system"))
+                    # Window Manager
+                    window_manager = window_manager_future.result()
+                    info_data.append((_LBL_WM, window_manager, "preferences-desktop-wallpaper"))
                 
-                # GPU
-                gpu_info = self.get_gpu_info()
-                info_data.append((_("Graphics"), gpu_info, "video-display"))
+                    # CPU
+                    cpu_info = cpu_info_future.result()
+                    cpu_count = psutil.cpu_count()
+                    cpu_text = f"{cpu_info} ({cpu_count} cores)"
+                    info_data.append((_LBL_CPU, cpu_text, "applications-system"))
                 
-                # Memory
-                memory = psutil.virtual_memory()
-                memory_text = f"{self.format_bytes(memory.used)} / {self.format_bytes(memory.total)} ({memory.percent:.1f}%)"
-                info_data.append((_("Memory"), memory_text, "drive-harddisk"))
+                    # GPU
+                    gpu_info = gpu_info_future.result()
+                    info_data.append((_LBL_GPU, gpu_info, "video-display"))
                 
-                # Disk Usage (root partition)
-                disk = psutil.disk_usage('/')
-                disk_text = f"{self.format_bytes(disk.used)} / {self.format_bytes(disk.total)} ({disk.percent:.1f}%)"
-                info_data.append((_("Disk Usage"), disk_text, "drive-harddisk"))
+                    # Memory
+                    memory = psutil.virtual_memory()
+                    memory_text = f"{self.format_bytes(memory.used)} / {self.format_bytes(memory.total)} ({memory.percent:.1f}%)"
+                    info_data.append((_LBL_MEMORY, memory_text, "drive-harddisk"))
                 
-                # Uptime
-                uptime = self.get_uptime()
-                info_data.append((_("Uptime"), uptime, "preferences-system-time"))
+                    # Disk Usage (root partition)
+                    disk = psutil.disk_usage('/')
+                    disk_text = f"{self.format_bytes(disk.used)} / {self.format_bytes(disk.total)} ({disk.percent:.1f}%)"
+                    info_data.append((_LBL_DISK, disk_text, "drive-harddisk"))
+                
+                    # Uptime
+                    uptime = uptime_future.result()
+                    info_data.append((_LBL_UPTIME, uptime, "preferences-system-time"))
                 
             except Exception as e:
                 print(f"Error loading system info: {e}")
-                info_data.append((_("Error"), _("Failed to load system information"), "dialog-error"))
+                info_data.append((_LBL_ERROR, _("Failed to load system information"), "dialog-error"))
             
             GLib.idle_add(self.update_ui, info_data)
         
@@ -684,10 +1035,16 @@ class LinexinSysInfoWidget(Gtk.Box):
     
     def update_ui(self, info_data):
         """Update the UI with system information"""
-        # Add rows
-        for label, value, icon in info_data:
-            row = self.create_info_row(label, value, icon)
-            self.info_listbox.append(row)
+        # Build all rows before touching the list box
+        rows = [self.create_info_row(label, value, icon) for label, value, icon in info_data]
+        
+        # Add rows with notifications held back until the batch is in
+        self.info_listbox.freeze_notify()
+        try:
+            for row in rows:
+                self.info_listbox.append(row)
+        finally:
+            self.info_listbox.thaw_notify()
         
         return False
 